@@ -1,7 +1,9 @@
 import sys
+from functools import cache
 from pathlib import Path
 
 
+@cache
 def get_root_dir() -> Path:
     if getattr(sys, "frozen", False):  # Check if running from the PyInstaller EXE
         return Path(getattr(sys, "_MEIPASS", "."))
@@ -1,6 +1,6 @@
+import logging
 import sys
-from socket import SocketType
-from typing import NoReturn, Optional
+from typing import NoReturn
 
 from PySide6.QtWidgets import QApplication
 
@@ -22,6 +22,7 @@ def run_app() -> NoReturn:
     stops. `sys.exit(0)` terminates the application.
 
     """
+    logging.basicConfig(level=logging.WARNING)
     version = '1.0.0'
     app = QApplication([])
     window = MainWindow(version=version)
@@ -1,26 +1,57 @@
-from PySide6.QtCore import QObject, QTimer, Signal
+from dataclasses import asdict
+from threading import Event
+from time import monotonic
 
+from PySide6.QtCore import QThread, Signal
 
-class Worker(QObject):
-    updated = Signal()
-    stop_requested = Signal()
-    stopped = Signal()
+from src.heu3.heu3_driver import HEUv3
 
-    def __init__(self) -> None:
+
+class TelemetryThread(QThread):
+    result_ready = Signal(dict)
+
+    def __init__(self, heu: HEUv3 | None = None, interval: float = 1.0) -> None:
         super().__init__()
-        self.timer = None
-        self.stop_requested.connect(self.stop)
+        self.heu = heu
+        self.interval = interval
+        self._wake = Event()
+        self._last_telemetry: dict = {}
 
-    def start(self) -> None:
-        self.timer = QTimer(self)
-        self.timer.setInterval(1000)
-        self.timer.timeout.connect(self.on_timeout)
-        self.timer.start()
+    def run(self) -> None:
+        next_poll = monotonic()
+        while not self.isInterruptionRequested():
+            if self.heu is not None:
+                # Drained even while disconnected, so queued commands fail right away
+                # instead of waiting for (and being sent late after) a reconnect
+                self.heu.process_requests()
+            if monotonic() >= next_poll:
+                next_poll = monotonic() + self.interval
+                if self.heu is not None and self.heu.is_connected:
+                    self.poll()
+            self._wake.wait(max(0.0, next_poll - monotonic()))
+            self._wake.clear()
 
-    def stop(self) -> None:
-        if self.timer and self.timer.isActive():
-            self.timer.stop()
-        self.stopped.emit()
+    def poll(self) -> None:
+        try:
+            telemetry = asdict(self.heu.snapshot(force=True))
+        except (ConnectionError, RuntimeError, TimeoutError, ValueError):
+            return  # Dropped or garbled reply; try again on the next tick
+        # Only cross the thread boundary with the readings that actually changed
+        changed = {
+            key: value
+            for key, value in telemetry.items()
+            if self._last_telemetry.get(key) != value
+        }
+        if changed:
+            self._last_telemetry = telemetry
+            self.result_ready.emit(changed)
 
-    def on_timeout(self) -> None:
-        self.updated.emit()
+    def wake(self) -> None:
+        """
+        Cuts the current wait short so queued HEU requests are sent right away.
+        """
+        self._wake.set()
+
+    def stop(self) -> None:
+        self.requestInterruption()
+        self.wake()
@@ -1,15 +1,12 @@
-from pathlib import Path
-from socket import SocketType
-from typing import Optional
+from concurrent.futures import Future
+from functools import cache
 
 from PySide6.QtCore import (
     QRegularExpression,
     Qt,
-    QThread,
     QTimer,
 )
 from PySide6.QtGui import (
-    QAction,
     QCloseEvent,
     QIcon,
     QRegularExpressionValidator,
@@ -19,16 +16,32 @@ from PySide6.QtWidgets import (
     QLabel,
     QLineEdit,
     QMainWindow,
-    QMessageBox,
-    QPushButton,
-    QVBoxLayout,
     QWidget,
 )
-from qt_material import apply_stylesheet
+from qt_material import build_stylesheet
 
+from helpers.constants import COM_PORT
 from helpers.helpers import get_root_dir
+from src.heu3.heu3_driver import HEUv3
 
-from .bg_thread import Worker
+from .bg_thread import TelemetryThread
+
+
+@cache
+def _app_icon() -> QIcon:
+    """
+    Loads the window icon once; deferred until first use so a QApplication exists.
+    """
+    return QIcon(str(get_root_dir() / 'assets' / 'hvps_icon.ico'))
+
+
+@cache
+def _stylesheet() -> str:
+    """
+    Renders the qt-material theme once, with the line edit color override appended.
+    """
+    stylesheet = build_stylesheet(theme='dark_lightgreen.xml', invert_secondary=True)
+    return stylesheet + """QLineEdit, QTextEdit {color: lightgreen;}"""
 
 
 class MainWindow(QMainWindow):
@@ -40,16 +53,22 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.version = version
         self.serial_number: str = ''
+        self.heu = HEUv3(com_port=COM_PORT)
+        self.telemetry: dict = {}
+        self._pending_telemetry: dict = {}
+
+        # Coalesce bursts of telemetry updates into one widget refresh
+        self._telemetry_timer = QTimer(self)
+        self._telemetry_timer.setSingleShot(True)
+        self._telemetry_timer.setInterval(50)
+        self._telemetry_timer.timeout.connect(self.apply_telemetry)
 
         # Handle background threading
-        self.worker_thread = QThread()
-        self.worker = Worker()
-        self.worker.moveToThread(self.worker_thread)
-        self.worker_thread.started.connect(self.worker.start)
-        self.worker.updated.connect(...)
-        self.worker_thread.start()
-        self.worker.stopped.connect(self.on_worker_stopped)
-        self._ready_to_quit = False
+        self.telemetry_thread = TelemetryThread(heu=self.heu)
+        self.telemetry_thread.result_ready.connect(
+            self.handle_telemetry, Qt.ConnectionType.QueuedConnection
+        )
+        self.telemetry_thread.start()
 
         self.create_gui()
 
@@ -61,22 +80,39 @@ class MainWindow(QMainWindow):
         window_width = 330
         window_height = 400
         self.setFixedSize(window_width, window_height)
-        root_dir: Path = get_root_dir()
-        icon_path: str = str(root_dir / 'assets' / 'hvps_icon.ico')
-        self.setWindowIcon(QIcon(icon_path))
+        self.setWindowIcon(_app_icon())
         self.setWindowTitle(f'HVPS Controller (v{self.version})')
-        apply_stylesheet(self, theme='dark_lightgreen.xml', invert_secondary=True)
-        self.setStyleSheet(
-            self.styleSheet() + """QLineEdit, QTextEdit {color: lightgreen;}"""
+        self.setStyleSheet(_stylesheet())
+
+        pump_speed_label = QLabel('Pump Speed (0-999)')
+        self.pump_speed_entry = QLineEdit()
+        self.pump_speed_entry.setValidator(
+            QRegularExpressionValidator(QRegularExpression(r'^\d{1,3}$'))
         )
+        self.pump_speed_entry.returnPressed.connect(self.handle_pump_speed_entered)
+        self.pump_speed_entry.returnPressed.connect(self.pump_speed_entry.clearFocus)
 
         main_layout = QGridLayout()
+        main_layout.addWidget(pump_speed_label, 0, 0)
+        main_layout.addWidget(self.pump_speed_entry, 0, 1)
 
         container = QWidget()
         container.setLayout(main_layout)
 
         self.setCentralWidget(container)
 
+    ####################################################################################
+    ############################### HEU Control Methods ################################
+    ####################################################################################
+
+    def handle_pump_speed_entered(self) -> None:
+        """
+        Sends the pump speed typed into the entry box to the HEU. The validator only
+        accepts 1-3 digits, so the entry is already a valid set point.
+        """
+        speed = min(int(self.pump_speed_entry.text()), 999)
+        self.submit(f'SPS{speed:03d}')
+
     ####################################################################################
     ########################## User Guide Menu Option Method ###########################
     ####################################################################################
@@ -91,10 +127,30 @@ class MainWindow(QMainWindow):
     ################################ Utility Methods ###################################
     ####################################################################################
 
-    def handle_return_pressed(self) -> None:
-        focused_widget = self.focusWidget()
+    def submit(self, query: str) -> Future[str]:
+        """
+        Queues a command for the telemetry thread to send to the HEU so the GUI
+        thread never blocks on serial I/O.
+        """
+        future = self.heu.submit(query)
+        self.telemetry_thread.wake()
+        return future
+
+    def handle_telemetry(self, changed: dict) -> None:
+        """
+        Stages the readings that changed since the last poll and schedules a single
+        refresh, so several updates arriving close together cost one repaint.
+        """
+        self._pending_telemetry.update(changed)
+        if not self._telemetry_timer.isActive():
+            self._telemetry_timer.start()
 
-        focused_widget.clearFocus()
+    def apply_telemetry(self) -> None:
+        """
+        Applies the staged telemetry changes.
+        """
+        self.telemetry.update(self._pending_telemetry)
+        self._pending_telemetry = {}
 
     ####################################################################################
     ############################ Close Main Window Methods #############################
@@ -106,24 +162,13 @@ class MainWindow(QMainWindow):
         """
         self.close()
 
-    def on_worker_stopped(self) -> None:
-        self.worker_thread.quit()
-        self.worker_thread.wait()
-        self._ready_to_quit = True
-        self.close()  # Now close safely
-
     def closeEvent(self, event: QCloseEvent) -> None:
         """
         Handles what happens when the main window is closed.
-        If self._ready_to_quit is True, close the socket and accept the close event.
-        Otherwise, tell the worker to emit the `stop_requested` Signal which will
-        tell the thread to stop and then emit the `stopped` Signal which will trigger
-        the `on_worker_stopped` method which will terminate the thread and close
-        the window.
+        Asks the telemetry thread to stop, waits for it to finish its current
+        transaction, closes the serial port, then accepts the close event.
         """
-        if self._ready_to_quit:
-            event.accept()
-        else:
-            self.worker.stop_requested.emit()
-            event.ignore()
+        self.telemetry_thread.stop()
+        self.telemetry_thread.wait()
+        self.heu.close_connection()
         super().closeEvent(event)
@@ -0,0 +1,320 @@
+"""
+async_heu3_driver.py
+
+Description: This driver contains the AsyncHEUv3 class, an asyncio front end for
+             HEUv3 so that several Oregon Physics Heat Exchange Units on different
+             serial ports can be polled concurrently from one event loop.
+
+Built with Python 3.13.3
+
+Author: Joshua Erbe
+Company: Oregon Physics, LLC.
+Version 1.0.0
+"""
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Self
+
+from .heu3_driver import HEUSnapshot, HEUv3
+
+
+class AsyncHEUv3:
+    """
+    Wraps an HEUv3 so its commands can be awaited. Each instance runs its commands on
+    its own single-thread executor, so commands to one HEU are still sent one at a
+    time, in the order they were awaited; the serial link cannot carry two
+    transactions at once, so awaiting several commands on the same instance is no
+    faster than calling them in sequence.
+
+    The gain is across units: the commands of different instances run on different
+    threads, so several HEUs can be polled in parallel with `asyncio.gather`:
+
+        inlet_temps = await asyncio.gather(*(heu.inlet_temp() for heu in heus))
+
+    Every read property of HEUv3 is available as a coroutine method of the same name,
+    and every setter as a `set_` coroutine method.
+    """
+
+    def __init__(
+        self,
+        com_port: str | None = None,
+        use_snapshot: bool = False,
+        heu: HEUv3 | None = None,
+    ) -> None:
+        # Only this instance's executor thread touches the HEU, so the driver's lock
+        # is not needed
+        self.heu = heu or HEUv3(
+            com_port=com_port, use_snapshot=use_snapshot, thread_safe=False
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f'AsyncHEUv3-{com_port}'
+        )
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Runs a blocking call on this instance's executor thread and awaits the result.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def _get(self, name: str) -> Any:
+        """
+        Reads a property of the wrapped HEUv3 on the executor thread.
+        """
+        return await self._run(getattr, self.heu, name)
+
+    async def _set(self, name: str, value: Any) -> None:
+        """
+        Sets a property of the wrapped HEUv3 on the executor thread.
+        """
+        await self._run(setattr, self.heu, name, value)
+
+    async def close(self) -> None:
+        """
+        Closes the serial connection once any queued commands have been sent, then
+        shuts down the executor.
+        """
+        await self._run(self.heu.close_connection)
+        self._executor.shutdown()
+
+    async def __aenter__(self) -> Self:
+        """
+        Returns this instance; the connection is closed when the block ends.
+        """
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """
+        Closes the connection when the async with-block ends.
+        """
+        await self.close()
+
+    ####################################################################################
+    ################################ HEU Commands ######################################
+    ####################################################################################
+
+    async def query(self, query: str) -> str:
+        """
+        Sends any command to the HEU and awaits the response, for commands without a
+        dedicated method.
+
+        Args:
+            query (str): The command string to send, without a terminator.
+
+        Returns:
+            str: The decoded and stripped response.
+        """
+        return await self._run(self.heu.query, query)
+
+    async def ping(self) -> str:
+        """
+        Pings the HEU, which answers `"WAZOO"`. See `HEUv3.ping()`.
+        """
+        return await self._run(self.heu.ping)
+
+    async def snapshot(self, force: bool = False) -> HEUSnapshot:
+        """
+        Reads every telemetry value in one serial transaction. See `HEUv3.snapshot()`.
+        """
+        return await self._run(self.heu.snapshot, force)
+
+    async def send_setters(self, commands: list[str]) -> None:
+        """
+        Sends several set commands in one write, confirmed by a ping. See
+        `HEUv3.send_setters()`.
+        """
+        await self._run(self.heu.send_setters, commands)
+
+    async def disable_echo(self) -> None:
+        """
+        Disables the echo of commands.
+        """
+        await self._run(self.heu.disable_echo)
+
+    async def enable_echo(self) -> None:
+        """
+        Enables the echo of commands (default state).
+        """
+        await self._run(self.heu.enable_echo)
+
+    async def enable_panel(self) -> None:
+        """
+        Enables the touchscreen panel (default state).
+        """
+        await self._run(self.heu.enable_panel)
+
+    async def disable_panel(self) -> None:
+        """
+        Disables the touchscreen panel (only pump on/off buttons work).
+        """
+        await self._run(self.heu.disable_panel)
+
+    async def inlet_temp(self) -> float:
+        """
+        Reads the inlet temperature of the Galden HT-270 in °C.
+        """
+        return await self._get('inlet_temp')
+
+    async def outlet_temp(self) -> float:
+        """
+        Reads the outlet temperature of the Galden HT-270 in °C.
+        """
+        return await self._get('outlet_temp')
+
+    async def flow_rate(self) -> float:
+        """
+        Reads the flow rate of the Galden in liters per minute.
+        """
+        return await self._get('flow_rate')
+
+    async def is_interlocked(self) -> bool:
+        """
+        Reads whether the interlock is open (not satisfied).
+        """
+        return await self._get('is_interlocked')
+
+    async def pump_status(self) -> tuple[int, int]:
+        """
+        Reads the status of pump 1 and pump 2 (`0` bad, `1` good, `2` manually off).
+        """
+        return await self._get('pump_status')
+
+    async def hour_meters(self) -> str:
+        """
+        Reads the unit-on, pump 1, and pump 2 hours as `"nnnnnn  nnnnnn  nnnnnn"`.
+        """
+        return await self._get('hour_meters')
+
+    async def hour_counters(self) -> tuple[int, int, int]:
+        """
+        Reads the unit-on, pump 1, and pump 2 hours as numbers.
+        """
+        return await self._get('hour_counters')
+
+    async def unit_hours(self) -> int:
+        """
+        Reads the number of hours the unit has been powered on.
+        """
+        return await self._get('unit_hours')
+
+    async def pump1_hours(self) -> int:
+        """
+        Reads the number of hours pump 1 has been running.
+        """
+        return await self._get('pump1_hours')
+
+    async def pump2_hours(self) -> int:
+        """
+        Reads the number of hours pump 2 has been running.
+        """
+        return await self._get('pump2_hours')
+
+    async def power_dissipated(self) -> int:
+        """
+        Reads the heat being exchanged in Watts.
+        """
+        return await self._get('power_dissipated')
+
+    async def leak_detected(self) -> bool:
+        """
+        Reads whether the leak detector sees liquid.
+        """
+        return await self._get('leak_detected')
+
+    async def datetime(self) -> str:
+        """
+        Reads the real-time clock used in logs.
+        """
+        return await self._get('datetime')
+
+    async def factory_info(self) -> str:
+        """
+        Reads the HEU build information.
+        """
+        return await self._get('factory_info')
+
+    async def serial_number(self) -> str:
+        """
+        Reads the unit's serial number.
+        """
+        return await self._get('serial_number')
+
+    async def protocol_version(self) -> str:
+        """
+        Reads the unit's protocol version.
+        """
+        return await self._get('protocol_version')
+
+    async def boot_ups(self) -> int:
+        """
+        Reads the number of times the unit has booted up.
+        """
+        return await self._get('boot_ups')
+
+    async def hardware_version(self) -> str:
+        """
+        Reads the unit's hardware version.
+        """
+        return await self._get('hardware_version')
+
+    async def software_version(self) -> str:
+        """
+        Reads the unit's software version.
+        """
+        return await self._get('software_version')
+
+    async def compile_date(self) -> str:
+        """
+        Reads the date the unit's software was compiled.
+        """
+        return await self._get('compile_date')
+
+    async def pumps_enabled(self) -> bool:
+        """
+        Reads whether the pumps On/Off switch is on.
+        """
+        return await self._get('pumps_enabled')
+
+    async def set_pumps_enabled(self, enable: bool) -> None:
+        """
+        Turns the pumps on (`True`) or off (`False`).
+        """
+        await self._set('pumps_enabled', enable)
+
+    async def pump_speed(self) -> int:
+        """
+        Reads the pump speed setting.
+        """
+        return await self._get('pump_speed')
+
+    async def set_pump_speed(self, value: int) -> None:
+        """
+        Sets the pump speed (0-999).
+        """
+        await self._set('pump_speed', value)
+
+    async def max_temp(self) -> int:
+        """
+        Reads the maximum temperature interlock set point in °C.
+        """
+        return await self._get('max_temp')
+
+    async def set_max_temp(self, value: float) -> None:
+        """
+        Sets the maximum temperature interlock set point (5-65 °C).
+        """
+        await self._set('max_temp', value)
+
+    async def min_flow(self) -> float:
+        """
+        Reads the minimum flow rate interlock set point in liters per minute.
+        """
+        return await self._get('min_flow')
+
+    async def set_min_flow(self, value: float) -> None:
+        """
+        Sets the minimum flow rate interlock set point (3.03-9.99 L/min).
+        """
+        await self._set('min_flow', value)
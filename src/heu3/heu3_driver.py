@@ -11,11 +11,122 @@ Company: Oregon Physics, LLC.
 Version 1.0.0
 """
 
-from threading import Lock
-from typing import Optional
+import logging
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from math import inf
+from queue import Empty, SimpleQueue
+from threading import RLock
+from time import monotonic
+from typing import Any, ClassVar, Self
 
 import serial
 
+logger = logging.getLogger(__name__)
+
+# Types accepted by the numeric setters
+_NUMERIC: tuple[type, ...] = (int, float)
+
+# Messages for out-of-range set points
+_PUMP_SPEED_ERR = 'Invalid speed setting. Setting must be between 0 and 999.'
+_MAX_TEMP_ERR = (
+    'Invalid maximum temperature interlock set point. '
+    'Valid set point is between 5-65 C.'
+)
+_MIN_FLOW_ERR = (
+    'Invalid minimum flow rate set point. Valid set point is between 3.03 and 9.99.'
+)
+
+
+def _is_set(response: bytes) -> bool:
+    """
+    Parses a status bit response. `b"1"` is set, anything else is clear.
+    """
+    return response == b'1'
+
+
+def _is_clear(response: bytes) -> bool:
+    """
+    Parses a status bit response. `b"0"` is clear, anything else is set.
+    """
+    return response == b'0'
+
+
+def _parse_pump_status(response: bytes) -> tuple[int, int]:
+    """
+    Parses the RPUMP response (e.g. `b"1,2"`) into the status of pump 1 and pump 2.
+    """
+    pump1, _, pump2 = response.partition(b',')
+    return (int(pump1), int(pump2))
+
+
+# The set command builders validate their set point and are the only place that
+# does. Only valid set points are cached, so repeating one skips the range check.
+
+
+@lru_cache(maxsize=1024)
+def _pump_speed_command(speed: int) -> bytes:
+    """
+    Builds the terminated, encoded SPS command for a pump speed (0-999).
+    """
+    if not 0 <= speed <= 999:
+        raise ValueError(_PUMP_SPEED_ERR)
+    return f'SPS{speed:03d}\r'.encode()
+
+
+@lru_cache(maxsize=64)
+def _max_temp_command(temp: float) -> bytes:
+    """
+    Builds the terminated, encoded SMAXT command for a temperature in °C (5-65).
+    Fractional degrees are truncated.
+    """
+    if not 5 <= temp <= 65:
+        raise ValueError(_MAX_TEMP_ERR)
+    return f'SMAXT{int(temp):02d}\r'.encode()
+
+
+@lru_cache(maxsize=1024)
+def _min_flow_command(flow: float) -> bytes:
+    """
+    Builds the terminated, encoded SMINF command for a flow rate in liters per minute
+    (3.03-9.99), rounded to the hundredths the HEU accepts.
+    """
+    # Anything that would round up to 10.00 is out of range too
+    if not 3.03 <= flow < 9.995:
+        raise ValueError(_MIN_FLOW_ERR)
+    return f'SMINF{flow:.2f}\r'.encode()
+
+
+class _NullLock:
+    """
+    Stands in for `threading.RLock` when the caller promises single-threaded access.
+    """
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> bool:
+        return False
+
+
+@dataclass(slots=True)
+class HEUSnapshot:
+    """
+    One reading of every telemetry value, taken in a single serial transaction.
+    Field order matches `HEUv3.TELEMETRY_COMMANDS`.
+    """
+
+    inlet_temp: float
+    outlet_temp: float
+    flow_rate: float
+    is_interlocked: bool
+    pump_status: tuple[int, int]
+    power_dissipated: int
+    leak_detected: bool
+
 
 class HEUv3:
     """
@@ -49,51 +160,661 @@ class HEUv3:
     * RMAXT: Read maximum interlock temperature setting in degrees C [nn]
     * RMINF: Read minimum interlock flow rate setting in liters per minute [n.nn]
     * !: Ping the heat exchange unit [`WAZOO`]
+
+    The telemetry read commands (RINTE, ROUTT, RFLOW, RINTR, RPUMP, RPOWR, RLEAK) can
+    be read together in a single serial transaction with `snapshot()`. With
+    `use_snapshot=True` the matching properties are answered from a snapshot that is
+    at most `SNAPSHOT_TTL` seconds old.
+
+    Every transaction holds a lock so several threads can share one HEUv3. Scripts
+    that only use the driver from one thread can pass `thread_safe=False` to skip
+    it; the serial link handles one command at a time regardless, so the lock never
+    adds throughput, only overhead. A burst of commands that must not be interleaved
+    with other threads' commands can hold the lock across all of them:
+
+        with heu.transaction():
+            heu.pumps_enabled = True
+            heu.pump_speed = 500
+            flow = heu.flow_rate
+
+    Single-value reads are cached for `_CACHE_TTL` seconds, so code that reads the
+    same value several times in quick succession costs one round-trip. While the
+    touchscreen panel is disabled the settings are cached until a set command changes
+    them; while it is enabled they are reused for `PANEL_SETTINGS_TTL` seconds. Set
+    `caching_enabled = False` to always read from the HEU.
+
+    Threads that must not block on serial I/O (e.g. the GUI thread) can `submit()` a
+    command instead; it is sent the next time the thread that owns the serial traffic
+    calls `process_requests()`.
     """
 
-    def __init__(self, com_port: Optional[str] = None) -> None:
-        self._lock = Lock()
+    # Fixed instance layout: no per-instance __dict__, and attribute loads on the
+    # query path are slot reads
+    __slots__ = (
+        '_cache',
+        '_caching_enabled',
+        '_com_port',
+        '_connected',
+        '_echo_enabled',
+        '_factory_info',
+        '_factory_info_parts',
+        '_hour_meters_parts',
+        '_hour_meters_ts',
+        '_lock',
+        '_panel_enabled',
+        '_requests',
+        '_rx_buf',
+        '_snapshot',
+        '_snapshot_ts',
+        '_term_bytes',
+        '_term_char',
+        'serial_port',
+        'use_snapshot',
+    )
+
+    TELEMETRY_COMMANDS = ('RINTE', 'ROUTT', 'RFLOW', 'RINTR', 'RPUMP', 'RPOWR', 'RLEAK')
+    _SNAPSHOT_FIELDS: ClassVar[dict[str, str]] = dict(
+        zip(TELEMETRY_COMMANDS, (field.name for field in fields(HEUSnapshot)))
+    )
+
+    # Seconds a snapshot is reused before the telemetry is read again
+    SNAPSHOT_TTL = 0.2
+
+    # How to parse the undecoded response of each single-value read command. Shared by
+    # the read properties and `snapshot()` so each is parsed in exactly one place.
+    # `int` and `float` accept bytes, so numbers are never decoded to str first.
+    _PARSERS: ClassVar[dict[str, Callable[[bytes], Any]]] = {
+        'RINTE': float,
+        'ROUTT': float,
+        'RFLOW': float,
+        'RINTR': _is_clear,
+        'RPUMP': _parse_pump_status,
+        'RPOWR': int,
+        'RLEAK': _is_set,
+        'RPSPD': int,
+        'RONOF': _is_set,
+        'RMAXT': int,
+        'RMINF': float,
+    }
+
+    # Terminated, encoded payloads for every command that takes no argument, built
+    # once when the class is loaded
+    _CMDS: ClassVar[dict[str, bytes]] = {
+        command: f'{command}\r'.encode()
+        for command in (
+            'RINTE',
+            'ROUTT',
+            'RFLOW',
+            'RINTR',
+            'RPUMP',
+            'RHOUR',
+            'RPOWR',
+            'RLEAK',
+            'RDATI',
+            'RFINF',
+            'RPSPD',
+            'RONOF',
+            'RMAXT',
+            'RMINF',
+            '!',
+            'DE',
+            'EE',
+            'EP',
+            'DP',
+            'ON',
+            'OFF',
+        )
+    }
+
+    # Commands that only read from the HEU, and so are safe to send in any order
+    _READ_COMMANDS = frozenset(command for command in _CMDS if command[0] == 'R')
+
+    # Most bytes taken from the serial port per read call
+    _READ_CHUNK = 2048
+
+    # Fewest bytes each command's response can have, including the terminator (e.g.
+    # `"n.n\r"` for a temperature). The first read of a response asks for at least
+    # this many bytes, so short fixed-format replies arrive in a single read call.
+    # These must never overestimate: a read asking for more bytes than the HEU sends
+    # blocks for the full port timeout. The echo is not counted, since the driver
+    # cannot be sure the unit is echoing.
+    _MIN_RESPONSE_LEN: ClassVar[dict[str, int]] = {
+        'RINTE': 4,
+        'ROUTT': 4,
+        'RFLOW': 5,
+        'RINTR': 2,
+        'RPUMP': 4,
+        'RPOWR': 2,
+        'RLEAK': 2,
+        'RPSPD': 2,
+        'RONOF': 2,
+        'RMAXT': 2,
+        'RMINF': 5,
+        '!': 6,
+    }
+
+    # Driver buffer sizes requested on Windows, where the defaults are small
+    _SERIAL_BUFFER_SIZE = 12800
+
+    # Seconds an RHOUR reading is reused. The counters only tick once an hour, so a
+    # diagnostics view refreshing them costs one serial round-trip per minute.
+    HOUR_METERS_TTL = 60.0
+
+    # Seconds a single-value read is reused. The settings only change when they are
+    # set, so they are kept until a set command invalidates them. The pumps on/off
+    # state is treated as a sensor reading since the panel's button always works.
+    _CACHE_TTL: ClassVar[dict[str, float]] = {
+        'RINTE': 0.05,
+        'ROUTT': 0.05,
+        'RFLOW': 0.05,
+        'RINTR': 0.05,
+        'RPUMP': 0.05,
+        'RPOWR': 0.05,
+        'RLEAK': 0.05,
+        'RONOF': 0.05,
+        'RPSPD': inf,
+        'RMAXT': inf,
+        'RMINF': inf,
+    }
+
+    # Seconds the settings are reused while the touchscreen panel is enabled (the
+    # default), since they can then be changed on the panel at any time
+    PANEL_SETTINGS_TTL = 1.0
+
+    # Cached reads made stale by each set command. Set commands not listed here clear
+    # the whole cache.
+    _INVALIDATES: tuple[tuple[bytes, tuple[str, ...]], ...] = (
+        (b'SPS', ('RPSPD',)),
+        (b'SMAXT', ('RMAXT',)),
+        (b'SMINF', ('RMINF',)),
+        (b'ON\r', ('RONOF', 'RPUMP')),
+        (b'OFF\r', ('RONOF', 'RPUMP')),
+    )
+
+    def __init__(
+        self,
+        com_port: str | None = None,
+        use_snapshot: bool = False,
+        thread_safe: bool = True,
+        caching_enabled: bool = True,
+        serial_port: serial.Serial | None = None,
+        baudrate: int = 38400,
+        timeout: float = 0.5,
+    ) -> None:
+        self._lock = RLock() if thread_safe else _NullLock()
         self._com_port = com_port
         self._term_char = '\r'
-        self.serial_port = None
-
-        if self._com_port:
-            self.open_connection(self._com_port)
+        self._term_bytes = self._term_char.encode()
+        self._rx_buf = bytearray()
+        self._echo_enabled = True  # The HEU echoes commands until told otherwise
+        self._panel_enabled = True  # Likewise for the touchscreen panel
+        self.serial_port = serial_port
+        self._connected = serial_port is not None and serial_port.is_open
+        self._requests: SimpleQueue[tuple[str, Future[str]]] = SimpleQueue()
+        self._factory_info: str | None = None
+        self._factory_info_parts: list[str] | None = None
+        self._hour_meters_parts: tuple[int, int, int] | None = None
+        self._hour_meters_ts = 0.0
+        self.use_snapshot = use_snapshot
+        self._snapshot: HEUSnapshot | None = None
+        self._snapshot_ts = 0.0
+        self._caching_enabled = caching_enabled
+        self._cache: dict[str, tuple[float, Any]] = {}
+
+        # An already open port (e.g. `serial.serial_for_url('loop://')` in tests) is
+        # used as is instead of opening `com_port`
+        if self._com_port and serial_port is None:
+            self.open_connection(self._com_port, baudrate=baudrate, timeout=timeout)
 
     def _send_query(self, query: str) -> str:
         """
         Sends a query command to the HEU, reads the response.
 
         Args:
-            query (str): The query command string to send.
+            query (str): The query command string to send, without a terminator.
                 The carriage return termination character is appended automatically.
 
         Returns:
             str: The decoded and stripped string response received from the instrument.
+
+        Raises:
+            RuntimeError: If no instrument is connected.
+            ConnectionError: If the serial port fails during the transaction.
+            TimeoutError: If the command is not sent or answered within the port's timeout.
+        """
+        return self._send_query_bytes((query + self._term_char).encode())
+
+    def _send_query_bytes(self, payload: bytes, min_len: int = 1) -> str:
+        """
+        Sends an already encoded and terminated command to the HEU, reads the response.
+        Commands that are known ahead of time are encoded once and sent through here
+        to skip the per-call string handling in `_send_query()`.
+
+        Args:
+            payload (bytes): The command, including the carriage return terminator.
+            min_len (int): The fewest bytes the response can have, including the
+                terminator. Defaults to 1.
+
+        Returns:
+            str: The decoded and stripped string response received from the instrument.
+
+        Raises:
+            RuntimeError: If no instrument is connected.
+            ConnectionError: If the serial port fails during the transaction.
+            TimeoutError: If the command is not sent or answered within the port's timeout.
+        """
+        return self._send_query_raw(payload, min_len).decode()
+
+    def _send_query_raw(self, payload: bytes, min_len: int = 1) -> bytes:
+        """
+        Sends an already encoded and terminated command to the HEU and returns the
+        response without decoding it, for callers that can parse bytes directly.
+
+        Args:
+            payload (bytes): The command, including the carriage return terminator.
+            min_len (int): The fewest bytes the response can have, including the
+                terminator. Defaults to 1.
+
+        Returns:
+            bytes: The response with the echo, terminator, and surrounding whitespace
+        removed.
+
+        Raises:
+            RuntimeError: If no instrument is connected.
+            ConnectionError: If the serial port fails during the transaction.
+            TimeoutError: If the command is not sent or answered within the port's timeout.
+        """
+        if not self._connected:
+            raise RuntimeError(
+                'Attempted to communicate with HEU, but no instrument is connected.'
+            )
+
+        with self._lock, self._serial_errors():
+            self._discard_stale_input()
+            self.serial_port.write(payload)
+            response = self._read_reply(payload, min_len)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Command %r -> %r', payload, response)
+        return response
+
+    @contextmanager
+    def _serial_errors(self) -> Iterator[None]:
+        """
+        Turns the pyserial exceptions raised by a transaction into the driver's own, so
+        every send path fails the same way. A write timeout leaves the port usable, like
+        a read timeout; any other serial failure marks the connection as lost.
+
+        Raises:
+            TimeoutError: If the command is not accepted within the port's write timeout.
+            ConnectionError: If the serial port fails during the transaction.
+        """
+        try:
+            yield
+        except serial.SerialTimeoutException as e:
+            raise TimeoutError(f'HEU did not accept the command in time: {e}') from e
+        except serial.SerialException as e:
+            self._connected = False
+            self._reset_connection_state()
+            logger.debug('Serial transaction failed', exc_info=True)
+            raise ConnectionError(f'Failed to communicate with the HEU: {e}') from e
+
+    def _discard_stale_input(self) -> None:
+        """
+        Drops any bytes left over from earlier commands (e.g. a late reply) so they are
+        not mistaken for the response to the next one. Only reads from the port when
+        something is actually waiting, instead of purging the driver buffer every time.
+        """
+        self._rx_buf.clear()
+        if waiting := self.serial_port.in_waiting:
+            self.serial_port.read(waiting)
+
+    def _read_reply(self, payload: bytes, min_len: int = 1) -> bytes:
+        """
+        Reads the response to one command that has just been written. While echo is
+        on, the HEU sends the command back, terminator included, ahead of the response;
+        that line is dropped. A line that is not the echo is taken as the response, so a
+        unit that has already stopped echoing is still read correctly. Call with the
+        lock held.
+
+        Args:
+            payload (bytes): The command that was written, including the terminator.
+            min_len (int): The fewest bytes still to come, including the terminator.
+                Defaults to 1.
+
+        Returns:
+            bytes: The response with the echo, terminator, and surrounding whitespace
+        removed.
+        """
+        echoing = self._echo_enabled
+        self._note_command(payload)
+        response = self._read_response(min_len).strip()
+        if echoing and response == payload[: -len(self._term_bytes)]:
+            response = self._read_response().strip()
+        return response
+
+    def _note_command(self, payload: bytes) -> None:
+        """
+        Keeps the driver's view of the HEU's modes, and its read cache, in step with the
+        commands written to it, whichever method sent them (e.g. a DE or SPS passed to
+        `send_setters()` or `submit()`).
+
+        Args:
+            payload (bytes): The command that was written, including the terminator.
+        """
+        if payload[:1] == b'R' or payload == self._CMDS['!']:
+            return
+        # Runs after the write and under the lock, so no read can store a value from
+        # before the set command once this has run
+        self._snapshot = None
+        if payload == self._CMDS['DE']:
+            self._echo_enabled = False
+        elif payload == self._CMDS['EE']:
+            self._echo_enabled = True
+        elif payload == self._CMDS['DP']:
+            self._panel_enabled = False
+        elif payload == self._CMDS['EP']:
+            self._panel_enabled = True
+        else:
+            for prefix, commands in self._INVALIDATES:
+                if payload.startswith(prefix):
+                    for command in commands:
+                        self._cache.pop(command, None)
+                    return
+            self._cache.clear()
+
+    def _read_response(self, min_len: int = 1) -> bytes:
+        """
+        Reads one response up to and including the termination character. Each read
+        call takes all of the bytes that have already arrived (up to `_READ_CHUNK`)
+        rather than one byte at a time like pyserial's `read_until`, and waits for at
+        least the `min_len` bytes the response is known to have. Bytes received after
+        the terminator stay in `_rx_buf` for the next response of the same transaction.
+
+        Gives up once the port's timeout has elapsed, even if bytes keep trickling in
+        without a terminator.
+
+        Args:
+            min_len (int): The fewest bytes still to come, including the terminator.
+                Defaults to 1.
+
+        Returns:
+            bytes: The raw response, including the terminator.
+
+        Raises:
+            TimeoutError: If no terminator arrives within the port's timeout.
+        """
+        timeout = self.serial_port.timeout
+        deadline = None if timeout is None else monotonic() + timeout
+        while (end := self._rx_buf.find(self._term_bytes)) == -1:
+            if deadline is not None and monotonic() >= deadline:
+                chunk = b''
+            else:
+                size = max(
+                    1,
+                    min_len - len(self._rx_buf),
+                    min(self._READ_CHUNK, self.serial_port.in_waiting),
+                )
+                chunk = self.serial_port.read(size)
+            if not chunk:
+                partial = bytes(self._rx_buf)
+                self._rx_buf.clear()
+                raise TimeoutError(
+                    f'HEU response not terminated within {timeout} s (got {partial!r}).'
+                )
+            self._rx_buf += chunk
+        end += len(self._term_bytes)
+        response = bytes(self._rx_buf[:end])
+        del self._rx_buf[:end]
+        return response
+
+    def _send_query_batch(self, queries: list[str]) -> list[bytes]:
+        """
+        Sends several query commands to the HEU in a single write, then reads back one
+        response per command. The HEU answers commands in the order they are received,
+        so this replaces N write/read round-trips with one write and N reads.
+
+        Args:
+            queries (list[str]): The query command strings to send, in order, without
+                terminators. The carriage return termination character is appended
+                automatically.
+
+        Returns:
+            list[bytes]: The stripped, undecoded responses, in the same order as
+        `queries`.
+
+        Raises:
+            RuntimeError: If no instrument is connected.
+            ConnectionError: If the serial port fails during the transaction.
+            TimeoutError: If the command is not sent or answered within the port's timeout.
         """
-        if not self.serial_port or not self.serial_port.is_open:
+        if not self._connected:
             raise RuntimeError(
                 'Attempted to communicate with HEU, but no instrument is connected.'
             )
-        if not query.endswith(self._term_char):
-            query += self._term_char
+        # Every response is already on its way once the batch is written, so the
+        # first read can wait for all of them
+        min_lens = [self._MIN_RESPONSE_LEN.get(query, 1) for query in queries]
+        min_len = sum(min_lens)
+        payloads = [
+            self._CMDS.get(query) or (query + self._term_char).encode()
+            for query in queries
+        ]
+
+        with self._lock, self._serial_errors():
+            self._discard_stale_input()
+            self.serial_port.write(b''.join(payloads))
+            responses: list[bytes] = []
+            for payload, response_min_len in zip(payloads, min_lens):
+                responses.append(self._read_reply(payload, min_len))
+                min_len -= response_min_len
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Commands %r -> %r', payloads, responses)
+        return responses
+
+    def send_setters(self, commands: list[str]) -> None:
+        """
+        Sends several set commands in a single write followed by a ping. The HEU handles
+        commands in the order they are received, so the ping's `"WAZOO"` reply confirms
+        that every set command before it was processed, without a round-trip per
+        command (e.g. when bringing the unit up with `['DE', 'SMAXT40', 'SPS500', 'ON']`).
+
+        Args:
+            commands (list[str]): The set command strings to send, in order.
 
+        Raises:
+            ConnectionError: If the ping is not answered with `"WAZOO"`.
+            TimeoutError: If the HEU stops responding before the ping is answered.
+        """
+        responses = self._send_query_batch([*commands, '!'])
+        if responses[-1] != b'WAZOO':
+            raise ConnectionError(
+                'HEU did not confirm the set commands '
+                f'(ping returned {responses[-1].decode(errors="replace")!r}).'
+            )
+
+    def read_many(self, commands: list[str], sequential: bool = False) -> list[str]:
+        """
+        Sends several read commands in a single serial transaction and returns their
+        responses, e.g. `read_many(['RPSPD', 'RMAXT', 'RMINF'])` to read all of the
+        settings in one round-trip. Use `snapshot()` for the telemetry values.
+
+        Args:
+            commands (list[str]): The read commands to send, in order.
+            sequential (bool): Send the commands one round-trip at a time instead, for
+                firmware that does not answer commands queued back to back. Defaults
+                to False.
+
+        Returns:
+            list[str]: The decoded and stripped responses, in the same order as
+        `commands`.
+
+        Raises:
+            ValueError: If any of `commands` is not a read command.
+        """
+        for command in commands:
+            if command not in self._READ_COMMANDS:
+                raise ValueError(f'{command!r} is not an HEU read command.')
+        if sequential:
+            return [self._send_query_bytes(self._CMDS[command]) for command in commands]
+        return [response.decode() for response in self._send_query_batch(commands)]
+
+    def _read(self, command: str) -> Any:
+        """
+        Sends a single-value read command and parses the response with its entry in
+        `_PARSERS`. In snapshot mode, telemetry commands are answered from
+        `snapshot()` instead. Otherwise a value read less than `_CACHE_TTL` seconds
+        ago is reused while caching is enabled.
+
+        Args:
+            command (str): One of the read commands in `_PARSERS`.
+
+        Returns:
+            Any: The parsed response.
+        """
+        if self.use_snapshot and command in self._SNAPSHOT_FIELDS:
+            return getattr(self.snapshot(), self._SNAPSHOT_FIELDS[command])
+        now = monotonic()
+        # One lookup, since a set command sent from another thread can drop the entry
+        # at any moment
+        entry = self._cache.get(command) if self._caching_enabled else None
+        if entry is not None:
+            read_at, value = entry
+            ttl = self._CACHE_TTL[command]
+            if ttl == inf and self._panel_enabled:
+                ttl = self.PANEL_SETTINGS_TTL
+            if now - read_at < ttl:
+                return value
+        # Held until the value is cached, so a set command sent from another thread
+        # cannot invalidate the entry before this older reading is stored
         with self._lock:
+            response = self._send_query_raw(
+                self._CMDS[command], self._MIN_RESPONSE_LEN[command]
+            )
+            value = self._PARSERS[command](response)
+            if self._caching_enabled:
+                self._cache[command] = (now, value)
+        return value
+
+    def _cached_factory_info(self) -> tuple[str, list[str]]:
+        """
+        Reads the factory information once and caches both the response and its
+        space-separated fields for the rest of the connection.
+
+        Returns:
+            tuple[str, list[str]]: The RFINF response and its fields.
+        """
+        if self._factory_info is None or self._factory_info_parts is None:
+            command = 'RFINF'
+            self._factory_info = self._send_query_bytes(self._CMDS[command])
+            self._factory_info_parts = self._factory_info.split(' ')
+        return self._factory_info, self._factory_info_parts
+
+    def _cached_hour_meters(self) -> tuple[int, int, int]:
+        """
+        Reads the hour meters, reusing the previous reading if it is younger than
+        `HOUR_METERS_TTL` seconds. The counters are parsed once per reading and kept
+        as ints, so the hour properties only index into them.
+
+        Returns:
+            tuple[int, int, int]: The unit, pump 1, and pump 2 hours.
+        """
+        now = monotonic()
+        if (
+            self._hour_meters_parts is None
+            or now - self._hour_meters_ts >= self.HOUR_METERS_TTL
+        ):
+            command = 'RHOUR'
+            response = self._send_query_raw(self._CMDS[command])
+            unit, pump1, pump2 = (int(hours) for hours in response.split(maxsplit=2))
+            self._hour_meters_parts = (unit, pump1, pump2)
+            self._hour_meters_ts = now
+        return self._hour_meters_parts
+
+    def invalidate_factory_cache(self) -> None:
+        """
+        Discards the cached factory information so the next read queries the HEU again.
+        Only needed if the unit is re-flashed while connected.
+        """
+        self._factory_info = None
+        self._factory_info_parts = None
+
+    def query(self, query: str) -> str:
+        """
+        Sends any command to the HEU and returns its response, for commands without a
+        dedicated method. Echo and cache state are kept in step with the command as
+        for every other method, so e.g. `query('DE')` is handled like
+        `disable_echo()`.
+
+        Args:
+            query (str): The command string to send, without a terminator (e.g.
+                `"SPS500"`). The carriage return is appended automatically.
+
+        Returns:
+            str: The decoded and stripped response.
+
+        Raises:
+            RuntimeError: If no instrument is connected.
+            ConnectionError: If the serial port fails during the transaction.
+            TimeoutError: If the command is not sent or answered within the port's timeout.
+        """
+        return self._send_query(query)
+
+    def submit(self, query: str) -> Future[str]:
+        """
+        Queues a command to be sent by the next call to `process_requests()` and
+        returns immediately.
+
+        Args:
+            query (str): The command string to send, without a terminator (e.g.
+                `"SPS500"`). The carriage return is appended when it is sent.
+
+        Returns:
+            Future[str]: Resolves to the HEU's response, or to the exception raised
+        while sending the command.
+        """
+        future: Future[str] = Future()
+        self._requests.put((query, future))
+        return future
+
+    def process_requests(self) -> None:
+        """
+        Sends every queued command in the order it was submitted and resolves its
+        future. Call this from the one thread that owns the serial traffic.
+
+        A read command that was already answered during this call, with no set
+        command sent since, is answered with the same response instead of being sent
+        again, so several widgets asking for the same value cost one round-trip.
+        """
+        responses: dict[str, str] = {}
+        while True:
             try:
-                self.serial_port.reset_input_buffer()
-                self.serial_port.write(query.encode())
-                raw_response: str = self.serial_port.read_until(
-                    self._term_char.encode()
-                ).decode()
-                formatted_response: str = raw_response.replace(query, '').strip()
-                return formatted_response
-
-            except Exception as e:
-                print(f'Unexpected Error sending query: {e}')
-                raise
+                query, future = self._requests.get_nowait()
+            except Empty:
+                return
+            if not future.set_running_or_notify_cancel():
+                continue
+            if query in responses:
+                future.set_result(responses[query])
+                continue
+            is_read = query in self._READ_COMMANDS
+            if not is_read:
+                # The set command may change what the earlier reads returned
+                responses.clear()
+            try:
+                response = self.query(query)
+            except Exception as e:  # noqa: BLE001
+                # Whatever went wrong belongs to the caller waiting on the future, and
+                # must not stop the commands queued behind this one from being sent
+                future.set_exception(e)
+                continue
+            if is_read:
+                responses[query] = response
+            future.set_result(response)
 
     def open_connection(
-        self, port: str, baudrate: int = 38400, timeout: float = 1.0
+        self, port: str, baudrate: int = 38400, timeout: float = 0.5
     ) -> serial.Serial | None:
         """
         Establishes a serial connection to the instrument at the specified COM port.
@@ -102,8 +823,11 @@ class HEUv3:
             port (str): The COM port where the HEU is connected (e.g., 'COM3' or '/dev/ttyUSB0').
                 The port name is automatically converted to uppercase.
             baudrate (int): The serial communication baud rate in bits per second. Defaults to 38400.
-            timeout (float): The read and write timeout in seconds. Defaults to 1.0.
+            timeout (float): The read and write timeout in seconds. The HEU answers
+                within tens of milliseconds, so this only bounds how long a missing
+                response stalls the caller. Defaults to 0.5.
         """
+        self._reset_connection_state()
         try:
             self.serial_port = serial.Serial(
                 port=port.upper(),
@@ -111,10 +835,105 @@ class HEUv3:
                 timeout=timeout,
                 write_timeout=timeout,
             )
+            # Only available on Windows
+            if hasattr(self.serial_port, 'set_buffer_size'):
+                self.serial_port.set_buffer_size(
+                    rx_size=self._SERIAL_BUFFER_SIZE, tx_size=self._SERIAL_BUFFER_SIZE
+                )
+            self._connected = True
 
         except Exception as e:
             print(f'Failed to make a serial connection to {port}.\n\n{str(e)}')
             self.serial_port = None
+            self._connected = False
+
+    def close_connection(self) -> None:
+        """
+        Closes the serial connection to the HEU, if one is open. Waits for any
+        transaction in progress to finish first.
+        """
+        if self.serial_port:
+            with self._lock:
+                self.serial_port.close()
+        self.serial_port = None
+        self._connected = False
+        self._reset_connection_state()
+
+    def _reset_connection_state(self) -> None:
+        """
+        Forgets everything learned from the current connection: the cached reads,
+        snapshot, hour meters, and factory information, and the echo and panel modes.
+        Called whenever the connection opens, closes, or fails, since a different unit
+        may be on the other end next time and nothing cached may outlive the link.
+        """
+        self.invalidate_factory_cache()
+        self._hour_meters_parts = None
+        self.clear_cache()
+        # The HEU echoes commands and enables its panel until told otherwise
+        self._echo_enabled = True
+        self._panel_enabled = True
+
+    @contextmanager
+    def transaction(self) -> Iterator[Self]:
+        """
+        Holds the transaction lock until the with-block ends, so the commands sent
+        inside it run back to back. The lock is reentrant, so each command re-taking it
+        is only a counter update. Does not open or close the connection.
+        """
+        with self._lock:
+            yield self
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> bool:
+        """
+        Closes the serial connection when the with-block ends, as `AsyncHEUv3` does.
+        """
+        self.close_connection()
+        return False
+
+    @property
+    def is_connected(self) -> bool:
+        """
+        GETTER: Whether the serial connection is open and has not failed since.
+
+        Returns:
+            bool: `True` if commands can be sent. `False` after a failed open, a serial
+        error, or `close_connection()`.
+        """
+        return self._connected
+
+    @property
+    def caching_enabled(self) -> bool:
+        """
+        GETTER: Whether single-value reads are answered from the read cache.
+
+        Returns:
+            bool: `True` if recent reads are reused. `False` if every read queries the
+        HEU.
+        """
+        return self._caching_enabled
+
+    @caching_enabled.setter
+    def caching_enabled(self, enable: bool) -> None:
+        """
+        SETTER: Turns the read cache on or off. Turning it off also empties it.
+
+        Args:
+            enable (bool): `True` to reuse recent reads. `False` to always query the HEU.
+        """
+        self._caching_enabled = enable
+        if not enable:
+            self.clear_cache()
+
+    def clear_cache(self) -> None:
+        """
+        Discards every cached single-value read, and the snapshot, so the next read of
+        each queries the HEU again.
+        """
+        self._cache.clear()
+        self._snapshot = None
 
     ####################################################################################
     ################################ HEU Commands ######################################
@@ -128,35 +947,68 @@ class HEUv3:
             str: The response from the instrument, which is expected to be "WAZOO".
         """
         command = '!'
-        return self._send_query(command)
+        return self._send_query_bytes(
+            self._CMDS[command], self._MIN_RESPONSE_LEN[command]
+        )
+
+    def snapshot(self, force: bool = False) -> HEUSnapshot:
+        """
+        Reads all of the telemetry values in one serial transaction instead of one
+        round-trip per value. While caching is enabled, a snapshot younger than
+        `SNAPSHOT_TTL` seconds is reused, unless a set command has been sent since.
+
+        Args:
+            force (bool): Always read from the HEU, ignoring the cached snapshot.
+                Defaults to False.
+
+        Returns:
+            HEUSnapshot: The telemetry values, parsed the same way as the properties of
+        the same name.
+        """
+        now = monotonic()
+        if (
+            force
+            or not self._caching_enabled
+            or self._snapshot is None
+            or now - self._snapshot_ts >= self.SNAPSHOT_TTL
+        ):
+            responses = self._send_query_batch(list(self.TELEMETRY_COMMANDS))
+            self._snapshot = HEUSnapshot(
+                *(
+                    self._PARSERS[command](response)
+                    for command, response in zip(self.TELEMETRY_COMMANDS, responses)
+                )
+            )
+            self._snapshot_ts = now
+        return self._snapshot
 
     def disable_echo(self) -> None:
         """
-        Disable echo.
+        Disable echo. Responses are then no longer searched for the echoed command.
         """
         command = 'DE'
-        self._send_query(command)
+        self._send_query_bytes(self._CMDS[command])
 
     def enable_echo(self) -> None:
         """
         Enable echo (default state).
         """
         command = 'EE'
-        self._send_query(command)
+        self._send_query_bytes(self._CMDS[command])
 
     def enable_panel(self) -> None:
         """
         Enable the touchscreen panel (default state).
         """
         command = 'EP'
-        self._send_query(command)
+        self._send_query_bytes(self._CMDS[command])
 
     def disable_panel(self) -> None:
         """
         Disable the touchscreen panel (only pump on/off buttons work).
         """
         command = 'DP'
-        self._send_query(command)
+        self._send_query_bytes(self._CMDS[command])
 
     @property
     def inlet_temp(self) -> float:
@@ -166,9 +1018,7 @@ class HEUv3:
         Returns:
             float: Inlet temperature of Galden in °C.
         """
-        command = 'RINTE'
-        response = self._send_query(command)
-        return float(response)
+        return self._read('RINTE')
 
     @property
     def outlet_temp(self) -> float:
@@ -178,9 +1028,7 @@ class HEUv3:
         Returns:
             float: Outlet temperature of Galden in °C.
         """
-        command = 'ROUTT'
-        response = self._send_query(command)
-        return float(response)
+        return self._read('ROUTT')
 
     @property
     def flow_rate(self) -> float:
@@ -190,9 +1038,7 @@ class HEUv3:
         Returns:
             float: Flow rate of Galden as measured by internal flow meter in liters per minute.
         """
-        command = 'RFLOW'
-        response = self._send_query(command)
-        return float(response)
+        return self._read('RFLOW')
 
     @property
     def is_interlocked(self) -> bool:
@@ -204,9 +1050,7 @@ class HEUv3:
         Returns:
             bool: `True` if the interlock is open (not satisfied). `False` if the interlock is circuit is closed (satisfied).
         """
-        command = 'RINTR'
-        response = self._send_query(command)
-        return response == '0'
+        return self._read('RINTR')
 
     @property
     def pump_status(self) -> tuple[int, int]:
@@ -217,11 +1061,7 @@ class HEUv3:
         Returns:
             int: `0` for bad, `1` for good, `2` for good but manually off.
         """
-        command = 'RPUMP'
-        response: list[str] = self._send_query(command).split(',')
-        pump1 = int(response[0])
-        pump2 = int(response[1])
-        return (pump1, pump2)
+        return self._read('RPUMP')
 
     @property
     def hour_meters(self) -> str:
@@ -231,9 +1071,18 @@ class HEUv3:
         Returns:
             str: unit-on hours, pump1 hours, pump2 hours in the form `"nnnnnn  nnnnnn  nnnnnn"`.
         """
-        command = 'RHOUR'
-        response = self._send_query(command)
-        return response
+        unit, pump1, pump2 = self._cached_hour_meters()
+        return f'{unit:06d}  {pump1:06d}  {pump2:06d}'
+
+    @property
+    def hour_counters(self) -> tuple[int, int, int]:
+        """
+        GETTER: Read the hour meters as numbers, in one round-trip.
+
+        Returns:
+            tuple[int, int, int]: unit-on hours, pump1 hours, pump2 hours.
+        """
+        return self._cached_hour_meters()
 
     @property
     def unit_hours(self) -> int:
@@ -243,9 +1092,8 @@ class HEUv3:
         Returns:
             int: Number of hours the unit has been powered on.
         """
-        # The first string is the unit-on hours.
-        hours = int(self.hour_meters.split('  ')[0])
-        return hours
+        # The first counter is the unit-on hours.
+        return self._cached_hour_meters()[0]
 
     @property
     def pump1_hours(self) -> int:
@@ -255,9 +1103,8 @@ class HEUv3:
         Returns:
             int: Number of hours that pump 1 has been running.
         """
-        # The second string is the pump1-on hours
-        hours = int(self.hour_meters.split('  ')[1])
-        return hours
+        # The second counter is the pump1-on hours
+        return self._cached_hour_meters()[1]
 
     @property
     def pump2_hours(self) -> int:
@@ -267,9 +1114,8 @@ class HEUv3:
         Returns:
             int: Number of hours that pump 2 has been running.
         """
-        # The second string is the pump1-on hours
-        hours = int(self.hour_meters.split('  ')[2])
-        return hours
+        # The third counter is the pump2-on hours
+        return self._cached_hour_meters()[2]
 
     @property
     def power_dissipated(self) -> int:
@@ -281,9 +1127,7 @@ class HEUv3:
         Returns:
             int: the power exchanged in the unit.
         """
-        command = 'RPOWR'
-        response = self._send_query(command)
-        return int(response)
+        return self._read('RPOWR')
 
     @property
     def leak_detected(self) -> bool:
@@ -295,9 +1139,7 @@ class HEUv3:
         Returns:
             bool: `True` if the leak detector sees liquid. `False` if the leak detector is dry.
         """
-        command = 'RLEAK'
-        response = self._send_query(command)
-        return response == '1'
+        return self._read('RLEAK')
 
     @property
     def datetime(self) -> str:
@@ -308,19 +1150,19 @@ class HEUv3:
             str: the current month, day, year, hour:minute:second.
         """
         command = 'RDATI'
-        return self._send_query(command)
+        return self._send_query_bytes(self._CMDS[command])
 
     @property
     def factory_info(self) -> str:
         """
-        GETTER: Read the HEU build information.
+        GETTER: Read the HEU build information. Only read from the HEU once per
+        connection, since it cannot change while the unit is running.
 
         Returns:
             str: serial number, protocol version, number of boot-ups, hardware
         version, software version, and compile date.
         """
-        command = 'RFINF'
-        return self._send_query(command)
+        return self._cached_factory_info()[0]
 
     @property
     def serial_number(self) -> str:
@@ -331,7 +1173,7 @@ class HEUv3:
             str: The unit's serial number.
         """
         # The first number in the string is the unit's serial number
-        return self.factory_info.split(' ')[0]
+        return self._cached_factory_info()[1][0]
 
     @property
     def protocol_version(self) -> str:
@@ -342,7 +1184,7 @@ class HEUv3:
             str: The units protocol version
         """
         # The second number in the string is the protocol version
-        return self.factory_info.split(' ')[1]
+        return self._cached_factory_info()[1][1]
 
     @property
     def boot_ups(self) -> int:
@@ -353,7 +1195,7 @@ class HEUv3:
             int: The number of times the unit has booted up.
         """
         # The third number in the string is the number of boot ups.
-        return int(self.factory_info.split(' ')[2])
+        return int(self._cached_factory_info()[1][2])
 
     @property
     def hardware_version(self) -> str:
@@ -364,7 +1206,7 @@ class HEUv3:
             str: The unit's hardware version.
         """
         # The fourth number in the string is the hardware version.
-        return self.factory_info.split(' ')[3]
+        return self._cached_factory_info()[1][3]
 
     @property
     def software_version(self) -> str:
@@ -375,7 +1217,7 @@ class HEUv3:
             str: The software version installed in the HEU
         """
         # The fifth number in the string is the software version.
-        return self.factory_info.split(' ')[4]
+        return self._cached_factory_info()[1][4]
 
     @property
     def compile_date(self) -> str:
@@ -386,7 +1228,7 @@ class HEUv3:
             str: The date that the software was compiled.
         """
         # The sixth (last) number in the string is the compile date.
-        response = self.factory_info.split(' ')
+        response = self._cached_factory_info()[1]
         month = response[5]
         day = response[6]
         year = response[7]
@@ -402,9 +1244,7 @@ class HEUv3:
         Returns:
             bool: `True` if ON/OFF button is ON. `False` if ON/OFF button is OFF.
         """
-        command = 'RONOF'
-        response = self._send_query(command)
-        return response == '1'
+        return self._read('RONOF')
 
     @pumps_enabled.setter
     def pumps_enabled(self, enable: bool) -> None:
@@ -420,7 +1260,7 @@ class HEUv3:
             command = 'ON'
         else:
             command = 'OFF'
-        self._send_query(command)
+        self._send_query_bytes(self._CMDS[command])
 
     @property
     def pump_speed(self) -> int:
@@ -430,9 +1270,7 @@ class HEUv3:
         Returns:
             str: The pump speed setting.
         """
-        command = 'RPSPD'
-        response = self._send_query(command)
-        return int(response)
+        return self._read('RPSPD')
 
     @pump_speed.setter
     def pump_speed(self, value: int) -> None:
@@ -446,20 +1284,13 @@ class HEUv3:
             TypeError: If `value` is not an integer.
             ValueError: If `value` is outside valid range (0-999).
         """
-        if not isinstance(value, int):
+        try:
+            speed = value.__index__()
+        except AttributeError:
             raise TypeError(
                 f'Argument of type {type(value).__name__} not allowed. Must be of type int.'
-            )
-        if not 0 <= value <= 999:
-            raise ValueError(
-                'Invalid speed setting. Setting must be between 0 and 999.'
-            )
-
-        speed_str = str(value)
-        # add leading zeros so string is always 3 chars long
-        speed_str = speed_str.zfill(3)
-        command = f'SPS{speed_str}'
-        self._send_query(command)
+            ) from None
+        self._send_query_bytes(_pump_speed_command(speed))
 
     @property
     def max_temp(self) -> int:
@@ -469,9 +1300,7 @@ class HEUv3:
         Returns:
             int: the temperature interlock set point.
         """
-        command = 'RMAXT'
-        response = self._send_query(command)
-        return int(response)
+        return self._read('RMAXT')
 
     @max_temp.setter
     def max_temp(self, value: float) -> None:
@@ -485,20 +1314,12 @@ class HEUv3:
             TypeError: If `value` is not an integer or float.
             ValueError: If `value` is outside valid range (5-65).
         """
-        if not isinstance(value, (int | float)):
+        if not isinstance(value, _NUMERIC):
             raise TypeError(
-                f'Argument of type {type(value).__name__} not allowed. Must be of type int.'
-            )
-
-        if not 5 <= value <= 65:
-            raise ValueError(
-                'Invalid maximum temperature interlock set point. Valid set point is between 5-65 C.'
+                f'Argument of type {type(value).__name__} not allowed. Must be of type int or float.'
             )
 
-        value = int(value)
-        set_point = str(value).zfill(2)
-        command = f'SMAXT{set_point}'
-        self._send_query(command)
+        self._send_query_bytes(_max_temp_command(value))
 
     @property
     def min_flow(self) -> float:
@@ -508,9 +1329,7 @@ class HEUv3:
         Returns:
             float: the flow rate interlock set point.
         """
-        command = 'RMINF'
-        response = self._send_query(command)
-        return float(response)
+        return self._read('RMINF')
 
     @min_flow.setter
     def min_flow(self, value: float) -> None:
@@ -524,16 +1343,8 @@ class HEUv3:
             TypeError: If `value` is not an integer or float.
             ValueError: If `value` is outside valid range (3.03-9.99).
         """
-        if not isinstance(value, (int | float)):
+        if not isinstance(value, _NUMERIC):
             raise TypeError(
                 f'Argument of type {type(value).__name__} not allowed. Must be of type int or float.'
             )
-        if not 3.03 <= value < 10:
-            raise ValueError(
-                'Invalid minimum flow rate set point. Valid set point is between 3.03 and 9.99.'
-            )
-
-        value = float(value)
-        set_point_str = f'{value:.2f}'
-        command = f'SMINF{set_point_str}'
-        self._send_query(command)
+        self._send_query_bytes(_min_flow_command(value))
@@ -0,0 +1,62 @@
+"""
+test_async_heu3_driver.py
+
+Description: Tests for the AsyncHEUv3 front end, run against the fake port from
+             test_heu3_driver.py.
+
+Run from the repository root with `python -m unittest`.
+"""
+
+import asyncio
+import unittest
+
+from src.heu3.async_heu3_driver import AsyncHEUv3
+from src.heu3.heu3_driver import HEUv3
+
+from .test_heu3_driver import FakeHEUPort
+
+
+class TestAsyncHEUv3(unittest.TestCase):
+    def test_reads_and_sets(self) -> None:
+        async def run() -> None:
+            port = FakeHEUPort()
+            async with AsyncHEUv3(heu=HEUv3(serial_port=port)) as heu:
+                self.assertEqual(
+                    await asyncio.gather(heu.inlet_temp(), heu.pump_speed()),
+                    [23.5, 500],
+                )
+                self.assertEqual((await heu.snapshot()).flow_rate, 4.2)
+                await heu.set_pump_speed(123)
+                self.assertEqual(port.writes[-1], b'SPS123\r')
+                self.assertEqual(await heu.query('RMAXT'), '40')
+                await heu.query('DE')
+                self.assertEqual(await heu.outlet_temp(), 25.1)
+            self.assertFalse(port.is_open)
+            self.assertEqual(port.stalls, 0)
+
+        asyncio.run(run())
+
+    def test_errors_propagate(self) -> None:
+        async def run() -> None:
+            async with AsyncHEUv3(heu=HEUv3(serial_port=FakeHEUPort())) as heu:
+                with self.assertRaises(ValueError):
+                    await heu.set_pump_speed(1000)
+
+        asyncio.run(run())
+
+    def test_each_instance_has_its_own_thread(self) -> None:
+        async def run() -> None:
+            ports = [FakeHEUPort(), FakeHEUPort()]
+            heus = [AsyncHEUv3(heu=HEUv3(serial_port=port)) for port in ports]
+            self.assertIsNot(heus[0]._executor, heus[1]._executor)
+            temps = await asyncio.gather(*(heu.inlet_temp() for heu in heus))
+            self.assertEqual(temps, [23.5, 23.5])
+            for heu in heus:
+                await heu.close()
+            self.assertEqual([port.is_open for port in ports], [False, False])
+
+        asyncio.run(run())
+
+
+if __name__ == '__main__':
+    unittest.main()
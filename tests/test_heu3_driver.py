@@ -0,0 +1,446 @@
+"""
+test_heu3_driver.py
+
+Description: Tests for the HEUv3 driver (serial framing, echo handling, caching,
+             set point validation, the request queue, and locking), run against a
+             fake port instead of a real HEU.
+
+Run from the repository root with `python -m unittest`.
+"""
+
+import threading
+import unittest
+from collections import deque
+from unittest import mock
+
+import serial
+
+from src.heu3.heu3_driver import HEUv3, _NullLock
+
+RESPONSES = {
+    'RINTE': '23.5',
+    'ROUTT': '25.1',
+    'RFLOW': '4.20',
+    'RINTR': '1',
+    'RPUMP': '1,2',
+    'RHOUR': '000120  000100  000050',
+    'RPOWR': '350',
+    'RLEAK': '0',
+    'RDATI': '10,15,26, 12:00:00',
+    'RFINF': '12345 1 00042 03 07 Oct 15 2026',
+    'RPSPD': '500',
+    'RONOF': '1',
+    'RMAXT': '40',
+    'RMINF': '3.50',
+    '!': 'WAZOO',
+}
+
+
+class FakeHEUPort:
+    """
+    Stands in for `serial.Serial` and answers like an HEU. `read(size)` follows
+    pyserial's blocking rules: it returns as soon as `size` bytes have arrived, or
+    whatever has arrived once the timeout elapses. Instead of sleeping through the
+    timeout it counts the stall, so tests can assert that the driver never asks for
+    more bytes than the HEU sends.
+    """
+
+    def __init__(
+        self,
+        responses: dict[str, str] | None = None,
+        echo: bool = True,
+        chunk_size: int | None = None,
+        unterminated: tuple[str, ...] = (),
+        timeout: float = 0.5,
+    ) -> None:
+        self.responses = {**RESPONSES, **(responses or {})}
+        self.echo = echo
+        self.chunk_size = chunk_size  # Deliver replies this many bytes at a time
+        self.unterminated = unterminated  # Commands whose reply never ends
+        self.timeout = timeout
+        self.is_open = True
+        self.writes: list[bytes] = []
+        self.read_calls = 0
+        self.stalls = 0
+        self._arriving: deque[bytes] = deque()
+        self._arrived = bytearray()
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self._arrived)
+
+    def write(self, data: bytes) -> int:
+        self.writes.append(bytes(data))
+        for command in bytes(data).decode().split('\r')[:-1]:
+            reply = f'{command}\r' if self.echo else ''
+            if command == 'DE':
+                self.echo = False
+            elif command == 'EE':
+                self.echo = True
+            elif command.startswith('SPS'):
+                self.responses['RPSPD'] = command[3:]
+            reply += self.responses.get(command, '')
+            if command not in self.unterminated:
+                reply += '\r'
+            encoded = reply.encode()
+            size = self.chunk_size or len(encoded) or 1
+            for start in range(0, len(encoded), size):
+                self._arriving.append(encoded[start : start + size])
+        return len(data)
+
+    def read(self, size: int = 1) -> bytes:
+        self.read_calls += 1
+        while len(self._arrived) < size and self._arriving:
+            self._arrived += self._arriving.popleft()
+        if len(self._arrived) < size:
+            self.stalls += 1
+        data = bytes(self._arrived[:size])
+        del self._arrived[:size]
+        return data
+
+    def close(self) -> None:
+        self.is_open = False
+
+
+class TestSingleReads(unittest.TestCase):
+    def setUp(self) -> None:
+        self.port = FakeHEUPort()
+        self.heu = HEUv3(serial_port=self.port)
+
+    def test_parses_each_read(self) -> None:
+        self.assertEqual(self.heu.inlet_temp, 23.5)
+        self.assertEqual(self.heu.pump_status, (1, 2))
+        self.assertFalse(self.heu.is_interlocked)
+        self.assertEqual(self.heu.ping(), 'WAZOO')
+        self.assertEqual(self.heu.hour_counters, (120, 100, 50))
+        self.assertEqual(self.heu.compile_date, 'Oct. 15, 2026')
+        self.assertEqual(self.port.stalls, 0)
+
+    def test_short_reply_takes_one_read_call(self) -> None:
+        self.heu.disable_echo()
+        self.port.read_calls = 0
+        self.assertTrue(self.heu.leak_detected is False)
+        self.assertEqual(self.port.read_calls, 1)
+
+    def test_unpadded_setting_does_not_stall(self) -> None:
+        port = FakeHEUPort(echo=False, responses={'RPSPD': '0', 'RMAXT': '5'})
+        heu = HEUv3(serial_port=port)
+        self.assertEqual(heu.pump_speed, 0)
+        self.assertEqual(heu.max_temp, 5)
+        self.assertEqual(port.stalls, 0)
+
+    def test_query_sends_bare_command(self) -> None:
+        self.assertEqual(self.heu.query('RPSPD'), '500')
+        self.assertEqual(self.port.writes[-1], b'RPSPD\r')
+
+    def test_not_connected(self) -> None:
+        with self.assertRaises(RuntimeError):
+            HEUv3().ping()
+
+
+class TestBatchedReads(unittest.TestCase):
+    def test_snapshot_is_one_write(self) -> None:
+        port = FakeHEUPort()
+        snapshot = HEUv3(serial_port=port).snapshot()
+        self.assertEqual(len(port.writes), 1)
+        self.assertEqual(snapshot.inlet_temp, 23.5)
+        self.assertEqual(snapshot.outlet_temp, 25.1)
+        self.assertEqual(snapshot.flow_rate, 4.2)
+        self.assertEqual(snapshot.pump_status, (1, 2))
+        self.assertEqual(snapshot.power_dissipated, 350)
+        self.assertFalse(snapshot.leak_detected)
+        self.assertEqual(port.stalls, 0)
+
+    def test_read_many_keeps_order(self) -> None:
+        heu = HEUv3(serial_port=FakeHEUPort())
+        self.assertEqual(heu.read_many(['RMINF', 'RPSPD']), ['3.50', '500'])
+        with self.assertRaises(ValueError):
+            heu.read_many(['ON'])
+
+    def test_send_setters_needs_ping_reply(self) -> None:
+        port = FakeHEUPort(responses={'!': 'NOPE'})
+        with self.assertRaises(ConnectionError):
+            HEUv3(serial_port=port).send_setters(['SPS500'])
+
+
+class TestFraming(unittest.TestCase):
+    def test_terminator_split_across_reads(self) -> None:
+        for chunk_size in (1, 2, 3):
+            port = FakeHEUPort(chunk_size=chunk_size)
+            heu = HEUv3(serial_port=port)
+            self.assertEqual(heu.flow_rate, 4.2)
+            self.assertEqual(heu.snapshot().pump_status, (1, 2))
+            self.assertEqual(port.stalls, 0)
+
+    def test_timeout_with_partial_frame(self) -> None:
+        port = FakeHEUPort(echo=False, unterminated=('RINTE',))
+        heu = HEUv3(serial_port=port)
+        with self.assertRaises(TimeoutError) as raised:
+            _ = heu.inlet_temp
+        self.assertIn('23.5', str(raised.exception))
+        # A timeout leaves the connection usable, and the partial frame is not
+        # mistaken for the next response
+        self.assertTrue(heu.is_connected)
+        self.assertEqual(heu.outlet_temp, 25.1)
+
+    def test_write_timeout_keeps_connection(self) -> None:
+        port = FakeHEUPort()
+        heu = HEUv3(serial_port=port)
+        with (
+            mock.patch.object(
+                port, 'write', side_effect=serial.SerialTimeoutException('Timeout')
+            ),
+            self.assertRaises(TimeoutError),
+        ):
+            heu.ping()
+        self.assertTrue(heu.is_connected)
+
+    def test_serial_error_disconnects(self) -> None:
+        port = FakeHEUPort()
+        heu = HEUv3(serial_port=port)
+        with (
+            mock.patch.object(port, 'write', side_effect=serial.SerialException),
+            self.assertRaises(ConnectionError),
+        ):
+            heu.ping()
+        self.assertFalse(heu.is_connected)
+
+
+class TestEcho(unittest.TestCase):
+    def test_echo_on(self) -> None:
+        port = FakeHEUPort(echo=True)
+        heu = HEUv3(serial_port=port)
+        self.assertEqual(heu.inlet_temp, 23.5)
+        self.assertEqual(heu.snapshot().pump_status, (1, 2))
+        self.assertEqual(port.stalls, 0)
+
+    def test_echo_off(self) -> None:
+        port = FakeHEUPort(echo=True)
+        heu = HEUv3(serial_port=port)
+        heu.disable_echo()
+        self.assertFalse(port.echo)
+        self.assertEqual(heu.inlet_temp, 23.5)
+        self.assertEqual(heu.snapshot().pump_status, (1, 2))
+        heu.enable_echo()
+        self.assertEqual(heu.pump_speed, 500)
+        self.assertEqual(port.stalls, 0)
+
+    def test_unit_already_not_echoing(self) -> None:
+        port = FakeHEUPort(echo=False)
+        heu = HEUv3(serial_port=port)
+        self.assertEqual(heu.inlet_temp, 23.5)
+        self.assertEqual(heu.snapshot().flow_rate, 4.2)
+        self.assertEqual(port.stalls, 0)
+
+    def test_echo_change_through_other_paths(self) -> None:
+        port = FakeHEUPort(echo=True)
+        heu = HEUv3(serial_port=port)
+        heu.send_setters(['DE', 'SPS500'])
+        self.assertEqual(heu.flow_rate, 4.2)
+        future = heu.submit('EE')
+        heu.process_requests()
+        future.result()
+        self.assertTrue(port.echo)
+        self.assertEqual(heu.query('RMAXT'), '40')
+        heu.query('DE')
+        self.assertEqual(heu.outlet_temp, 25.1)
+        self.assertEqual(port.stalls, 0)
+
+
+class TestReadCache(unittest.TestCase):
+    def test_set_command_invalidates_setting(self) -> None:
+        port = FakeHEUPort()
+        heu = HEUv3(serial_port=port)
+        heu.disable_panel()
+        self.assertEqual(heu.pump_speed, 500)
+        port.responses['RPSPD'] = '123'
+        self.assertEqual(heu.pump_speed, 500)  # Cached while the panel is off
+        future = heu.submit('SPS123')
+        heu.process_requests()
+        future.result()
+        self.assertEqual(heu.pump_speed, 123)
+
+    def test_reconnect_drops_cached_values(self) -> None:
+        first = FakeHEUPort()
+        heu = HEUv3(serial_port=first)
+        heu.disable_panel()
+        self.assertEqual(heu.pump_speed, 500)
+        self.assertEqual(heu.unit_hours, 120)
+        second = FakeHEUPort(responses={'RPSPD': '123', 'RHOUR': '7 8 9'})
+        with mock.patch.object(serial, 'Serial', return_value=second):
+            heu.open_connection('COM9')
+        self.assertEqual(heu.pump_speed, 123)
+        self.assertEqual(heu.unit_hours, 7)
+
+    def test_disconnect_drops_cached_values(self) -> None:
+        port = FakeHEUPort()
+        heu = HEUv3(serial_port=port, use_snapshot=True)
+        heu.disable_panel()
+        self.assertEqual(heu.pump_speed, 500)
+        self.assertEqual(heu.inlet_temp, 23.5)
+        self.assertEqual(heu.serial_number, '12345')
+        self.assertEqual(heu.unit_hours, 120)
+        heu.close_connection()
+        for name in ('pump_speed', 'inlet_temp', 'serial_number', 'unit_hours'):
+            with self.assertRaises(RuntimeError):
+                getattr(heu, name)
+
+    def test_serial_error_drops_cached_values(self) -> None:
+        port = FakeHEUPort()
+        heu = HEUv3(serial_port=port)
+        heu.disable_panel()
+        self.assertEqual(heu.pump_speed, 500)
+        self.assertEqual(heu.serial_number, '12345')
+        with (
+            mock.patch.object(port, 'write', side_effect=serial.SerialException),
+            self.assertRaises(ConnectionError),
+        ):
+            heu.ping()
+        with self.assertRaises(RuntimeError):
+            _ = heu.pump_speed
+        with self.assertRaises(RuntimeError):
+            _ = heu.serial_number
+
+    def test_set_command_invalidates_snapshot(self) -> None:
+        port = FakeHEUPort()
+        heu = HEUv3(serial_port=port, use_snapshot=True)
+        self.assertEqual(heu.pump_status, (1, 2))
+        port.responses['RPUMP'] = '2,2'
+        heu.pumps_enabled = False
+        self.assertEqual(heu.pump_status, (2, 2))
+
+    def test_caching_disabled_skips_snapshot_ttl(self) -> None:
+        port = FakeHEUPort()
+        heu = HEUv3(serial_port=port, caching_enabled=False)
+        heu.snapshot()
+        heu.snapshot()
+        self.assertEqual(len(port.writes), 2)
+        heu.caching_enabled = True
+        heu.snapshot()
+        heu.snapshot()
+        self.assertEqual(len(port.writes), 2)
+        heu.caching_enabled = False
+        heu.snapshot()
+        self.assertEqual(len(port.writes), 3)
+
+
+class TestSetters(unittest.TestCase):
+    def setUp(self) -> None:
+        self.port = FakeHEUPort()
+        self.heu = HEUv3(serial_port=self.port)
+
+    def test_min_flow_rounding_boundary(self) -> None:
+        self.heu.min_flow = 3.03
+        self.assertEqual(self.port.writes[-1], b'SMINF3.03\r')
+        self.heu.min_flow = 9.994
+        self.assertEqual(self.port.writes[-1], b'SMINF9.99\r')
+        for flow in (3.02, 9.995, 10):
+            with self.assertRaises(ValueError):
+                self.heu.min_flow = flow
+
+    def test_pump_speed_accepts_integer_types_only(self) -> None:
+        class Index:
+            def __index__(self) -> int:
+                return 7
+
+        self.heu.pump_speed = Index()
+        self.assertEqual(self.port.writes[-1], b'SPS007\r')
+        for value in (5.0, '500'):
+            with self.assertRaises(TypeError):
+                self.heu.pump_speed = value
+        with self.assertRaises(ValueError):
+            self.heu.pump_speed = 1000
+
+    def test_numeric_setters_reject_other_types(self) -> None:
+        writes = len(self.port.writes)
+        for name in ('max_temp', 'min_flow'):
+            with self.assertRaises(TypeError):
+                setattr(self.heu, name, '5')
+        with self.assertRaises(TypeError):
+            self.heu.pumps_enabled = 1
+        self.assertEqual(len(self.port.writes), writes)
+
+
+class TestRequestQueue(unittest.TestCase):
+    def test_duplicate_reads_are_coalesced(self) -> None:
+        port = FakeHEUPort()
+        heu = HEUv3(serial_port=port, caching_enabled=False)
+        futures = [heu.submit('RINTE') for _ in range(3)]
+        heu.process_requests()
+        self.assertEqual([future.result() for future in futures], ['23.5'] * 3)
+        self.assertEqual(port.writes.count(b'RINTE\r'), 1)
+
+    def test_set_command_resets_coalescing(self) -> None:
+        port = FakeHEUPort()
+        heu = HEUv3(serial_port=port, caching_enabled=False)
+        before = heu.submit('RPSPD')
+        heu.submit('SPS123')
+        after = heu.submit('RPSPD')
+        heu.process_requests()
+        self.assertEqual((before.result(), after.result()), ('500', '123'))
+        self.assertEqual(port.writes.count(b'RPSPD\r'), 2)
+
+    def test_failures_resolve_their_future(self) -> None:
+        heu = HEUv3()
+        future = heu.submit('RINTE')
+        heu.process_requests()
+        with self.assertRaises(RuntimeError):
+            future.result(timeout=0)
+
+
+class TestHourMeters(unittest.TestCase):
+    def test_reading_is_reused_within_ttl(self) -> None:
+        port = FakeHEUPort()
+        heu = HEUv3(serial_port=port)
+        self.assertEqual(heu.unit_hours, 120)
+        self.assertEqual(heu.pump1_hours, 100)
+        self.assertEqual(heu.pump2_hours, 50)
+        self.assertEqual(heu.hour_meters, '000120  000100  000050')
+        self.assertEqual(port.writes.count(b'RHOUR\r'), 1)
+
+    def test_reading_expires(self) -> None:
+        port = FakeHEUPort()
+        heu = HEUv3(serial_port=port)
+        self.assertEqual(heu.unit_hours, 120)
+        port.responses['RHOUR'] = '000121  000100  000050'
+        with mock.patch.object(HEUv3, 'HOUR_METERS_TTL', 0.0):
+            self.assertEqual(heu.unit_hours, 121)
+        self.assertEqual(port.writes.count(b'RHOUR\r'), 2)
+
+
+class TestLifetime(unittest.TestCase):
+    def test_transaction_holds_other_threads_off(self) -> None:
+        port = FakeHEUPort()
+        heu = HEUv3(serial_port=port)
+        other = threading.Thread(target=heu.ping)
+        with heu.transaction() as same:
+            self.assertIs(same, heu)
+            other.start()
+            other.join(0.05)
+            self.assertTrue(other.is_alive())
+            heu.pump_speed = 500
+            self.assertEqual(heu.flow_rate, 4.2)
+        other.join(1.0)
+        self.assertFalse(other.is_alive())
+        self.assertEqual(port.writes[-1], b'!\r')
+        self.assertTrue(heu.is_connected)
+
+    def test_with_statement_closes_port(self) -> None:
+        port = FakeHEUPort()
+        with HEUv3(serial_port=port) as heu:
+            self.assertEqual(heu.ping(), 'WAZOO')
+        self.assertFalse(port.is_open)
+        self.assertFalse(heu.is_connected)
+
+    def test_thread_unsafe_driver(self) -> None:
+        port = FakeHEUPort()
+        heu = HEUv3(serial_port=port, thread_safe=False)
+        self.assertIsInstance(heu._lock, _NullLock)
+        with heu.transaction():
+            self.assertEqual(heu.inlet_temp, 23.5)
+            self.assertEqual(heu.snapshot().flow_rate, 4.2)
+        self.assertEqual(port.stalls, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()